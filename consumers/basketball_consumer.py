@@ -7,16 +7,18 @@ Consumes basketball scoring events from Kafka and performs real-time analytics
 # Import Modules
 #####################################
 
-import json
-from collections import deque
+import multiprocessing as mp
+import queue
+import sys
+import threading
 
 # Import from existing utils
 from utils.utils_consumer import create_kafka_consumer
 from utils.utils_logger import logger
-from utils.message_validator import validate_message
+from utils.message_validator import validate_message, Event
 
 # Import visualizer
-from consumers.visualizer import BasketballVisualizer
+from consumers.visualizer import viz_main
 
 # Import game configuration
 from data.game_config import get_all_team_names
@@ -27,7 +29,7 @@ from data.game_config import get_all_team_names
 
 TOPIC_NAME = "basketball-game"
 CONSUMER_GROUP = "basketball-analytics-group"
-MAX_EVENTS_TO_DISPLAY = 50  # Keep last 50 events for visualization
+SCORE_QUEUE_SIZE = 1000  # Bounded queue feeding the visualizer process
 
 #####################################
 # Analytics Class
@@ -36,24 +38,30 @@ MAX_EVENTS_TO_DISPLAY = 50  # Keep last 50 events for visualization
 class BasketballAnalytics:
     """Processes basketball scoring events and maintains game state"""
     
-    def __init__(self):
-        """Initialize analytics tracking"""
-        self.home_team, self.away_team = get_all_team_names()
+    def __init__(self, score_queue):
+        """
+        Initialize analytics tracking
+
+        Args:
+            score_queue: Bounded multiprocessing.Queue feeding the
+                visualizer process with (game_time, score_home, score_away)
+        """
+        self.score_queue = score_queue
+        # Interned so the hot-path equality checks below can short-circuit
+        # on pointer identity when the names are the same object
+        home_team, away_team = get_all_team_names()
+        self.home_team = sys.intern(home_team)
+        self.away_team = sys.intern(away_team)
+        # Indexable pair for branch-free leader lookup on the hot path
+        self._teams = (self.home_team, self.away_team)
         
         # Score tracking
         self.score_home = 0
         self.score_away = 0
         
-        # Event counting
-        self.events_per_team = {
-            self.home_team: 0,
-            self.away_team: 0
-        }
-        
-        # Data for visualization (using deque for efficient FIFO)
-        self.game_times = deque(maxlen=MAX_EVENTS_TO_DISPLAY)
-        self.home_scores = deque(maxlen=MAX_EVENTS_TO_DISPLAY)
-        self.away_scores = deque(maxlen=MAX_EVENTS_TO_DISPLAY)
+        # Event counting (scalar counters, no per-event dict hashing)
+        self._home_count = 0
+        self._away_count = 0
         
         # Momentum tracking
         self.last_scoring_team = None
@@ -63,26 +71,28 @@ class BasketballAnalytics:
         
         logger.info(f"Analytics initialized: {self.home_team} vs {self.away_team}")
     
-    def process_event(self, event_data: dict):
+    def process_event(self, event_data: Event):
         """
         Process a single scoring event
-        
+
         Args:
-            event_data: Dictionary containing scoring event information
+            event_data: Validated Event struct from the message validator
         """
         self.total_events += 1
+
+        # Extract event details (struct attribute slots, not dict lookups)
+        game_time = event_data.game_time
+        team = event_data.team
+        player = event_data.player
+        points = event_data.points
+        self.score_home = event_data.score_home
+        self.score_away = event_data.score_away
         
-        # Extract event details
-        game_time = event_data['game_time']
-        team = event_data['team']
-        player = event_data['player']
-        points = event_data['points']
-        self.score_home = event_data['score_home']
-        self.score_away = event_data['score_away']
-        
-        # Update event count
-        if team in self.events_per_team:
-            self.events_per_team[team] += 1
+        # Update event count (unknown team names are ignored, as before)
+        if team == self.home_team:
+            self._home_count += 1
+        elif team == self.away_team:
+            self._away_count += 1
         
         # Track momentum
         if team == self.last_scoring_team:
@@ -93,58 +103,86 @@ class BasketballAnalytics:
         
         # Check for momentum shift (6+ consecutive points)
         if self.consecutive_scores >= 6:
-            logger.info(f" MOMENTUM SHIFT: {team} has scored {self.consecutive_scores} consecutive points!")
+            logger.info(" MOMENTUM SHIFT: {} has scored {} consecutive points!",
+                        team, self.consecutive_scores)
         
-        # Add to visualization data
-        self.game_times.append(game_time)
-        self.home_scores.append(self.score_home)
-        self.away_scores.append(self.score_away)
+        # Feed the visualizer process; drop the update if the queue is
+        # full -- the display is best-effort and must never block ingestion
+        try:
+            self.score_queue.put_nowait((game_time, self.score_home, self.score_away))
+        except queue.Full:
+            pass
         
-        # Calculate point differential
-        differential = abs(self.score_home - self.score_away)
-        leader = self.home_team if self.score_home > self.score_away else self.away_team
-        
-        # Log event
+        # Calculate point differential (branch-free: sign-mask abs and
+        # bool-indexed leader lookup instead of abs() + ternary)
+        diff = self.score_home - self.score_away
+        sign = diff >> 31
+        differential = (diff ^ sign) - sign
+        leader = self._teams[diff <= 0]
+
+        # Log event (deferred {} formatting: loguru skips the substitution
+        # entirely when INFO is below every sink's level, unlike an f-string
+        # which is built eagerly on every call)
         logger.info(
-            f"Event #{self.total_events} | {game_time} | "
-            f"{team}: {player} scores {points} pts | "
-            f"Score: {self.score_home}-{self.score_away} | "
-            f"{leader} leads by {differential}"
+            "Event #{} | {} | {}: {} scores {} pts | Score: {}-{} | {} leads by {}",
+            self.total_events, game_time, team, player, points,
+            self.score_home, self.score_away, leader, differential
         )
     
-    def get_visualization_data(self) -> dict:
-        """
-        Get current data for visualization
-        
-        Returns:
-            Dictionary containing visualization data
-        """
-        return {
-            'game_times': list(self.game_times),
-            'home_scores': list(self.home_scores),
-            'away_scores': list(self.away_scores),
-            'home_team': self.home_team,
-            'away_team': self.away_team,
-            'current_home_score': self.score_home,
-            'current_away_score': self.score_away
-        }
-    
     def get_summary(self) -> str:
         """Generate game summary statistics"""
-        differential = abs(self.score_home - self.score_away)
-        leader = self.home_team if self.score_home > self.score_away else self.away_team
+        diff = self.score_home - self.score_away
+        sign = diff >> 31
+        differential = (diff ^ sign) - sign
+        leader = self._teams[diff <= 0]
         
         summary = f"\n{'='*50}\n"
         summary += "GAME SUMMARY\n"
         summary += f"{'='*50}\n"
-        summary += f"{self.home_team}: {self.score_home} ({self.events_per_team[self.home_team]} scores)\n"
-        summary += f"{self.away_team}: {self.score_away} ({self.events_per_team[self.away_team]} scores)\n"
+        summary += f"{self.home_team}: {self.score_home} ({self._home_count} scores)\n"
+        summary += f"{self.away_team}: {self.score_away} ({self._away_count} scores)\n"
         summary += f"Leader: {leader} by {differential} points\n"
         summary += f"Total events processed: {self.total_events}\n"
         summary += f"{'='*50}\n"
         
         return summary
 
+#####################################
+# Worker Thread
+#####################################
+
+def process_messages(message_queue, analytics: BasketballAnalytics):
+    """
+    Worker loop: validate and process raw messages from the Kafka reader
+
+    Runs in its own thread fed by a single-producer/single-consumer
+    queue.SimpleQueue, so broker reads overlap with parse and analytics
+    work. Exits when the None shutdown sentinel arrives.
+
+    Args:
+        message_queue: queue.SimpleQueue of raw message bytes
+        analytics: BasketballAnalytics instance to feed
+    """
+    while True:
+        raw_message = message_queue.get()
+
+        if raw_message is None:
+            break
+
+        # Validate message (raw bytes from Kafka); validate_message never
+        # raises -- parse and schema failures come back in error_msg
+        is_valid, event_data, error_msg = validate_message(raw_message)
+
+        if not is_valid:
+            logger.warning("Invalid message: {}", error_msg)
+            continue
+
+        # Process the event
+        try:
+            analytics.process_event(event_data)
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+
 #####################################
 # Main Consumer Function
 #####################################
@@ -160,59 +198,77 @@ def consume_basketball_events():
     try:
         consumer = create_kafka_consumer(
             topic_provided=TOPIC_NAME,
-            group_id_provided=CONSUMER_GROUP
+            group_id_provided=CONSUMER_GROUP,
+            # Pass raw bytes through; validate_message parses bytes directly
+            value_deserializer_provided=lambda value: value
         )
     except Exception as e:
         logger.error(f"Failed to create consumer: {e}")
         return
     
+    # Bounded queue carrying score tuples to the visualizer process
+    score_queue = mp.Queue(maxsize=SCORE_QUEUE_SIZE)
+
     # Initialize analytics
-    analytics = BasketballAnalytics()
-    
-    # Initialize visualizer
-    visualizer = BasketballVisualizer(analytics)
-    
+    analytics = BasketballAnalytics(score_queue)
+
+    # Run visualization in a separate process so matplotlib drawing never
+    # competes with message decode/validation for this process's GIL
+    viz_process = mp.Process(target=viz_main, args=(score_queue,), daemon=True)
+
+    # SPSC handoff between the Kafka reader (this thread) and the
+    # validate/process worker. SimpleQueue puts and gets are C-level and
+    # skip queue.Queue's condition-variable machinery.
+    message_queue = queue.SimpleQueue()
+    worker = threading.Thread(target=process_messages,
+                              args=(message_queue, analytics), daemon=True)
+
     logger.info("Consumer ready. Waiting for messages...")
     logger.info("Press Ctrl+C to stop.\n")
     
     try:
-        # Start visualization in a separate thread
-        visualizer.start()
-        
-        # Consume messages
-        for message in consumer:
-            try:
-                # Get message value (already deserialized to string by utils_consumer)
-                message_str = message.value
-                
-                # Validate message
-                is_valid, event_data, error_msg = validate_message(message_str)
-                
-                if not is_valid:
-                    logger.warning(f"Invalid message: {error_msg}")
-                    continue
-                
-                # Process the event
-                analytics.process_event(event_data)
-                
-                # Update visualization
-                visualizer.update()
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}")
-            except Exception as e:
-                logger.error(f"Error processing message: {e}")
+        # Start the worker thread and the visualizer process
+        worker.start()
+        viz_process.start()
+
+        # Read messages in batches (amortizes poll overhead across
+        # records) and hand the raw bytes straight to the worker
+        while True:
+            records = consumer.poll(timeout_ms=500, max_records=500)
+
+            if not records:
+                continue
+
+            for topic_partition, messages in records.items():
+                for message in messages:
+                    message_queue.put(message.value)
     
     except KeyboardInterrupt:
         logger.info("\nConsumer interrupted by user.")
     except Exception as e:
         logger.error(f"Consumer error: {e}")
     finally:
+        # Stop the worker: the sentinel lands after any queued messages,
+        # so everything already read gets processed before the summary.
+        # (ident is None if startup failed before the thread ever ran;
+        # joining an unstarted thread would raise inside this cleanup)
+        if worker.ident is not None:
+            message_queue.put(None)
+            worker.join(timeout=5)
+
         # Print final summary
         logger.info(analytics.get_summary())
-        
-        # Stop visualizer
-        visualizer.stop()
+
+        # Signal the visualizer process to shut down and wait for it
+        # (pid is None if the process never started)
+        if viz_process.pid is not None:
+            try:
+                score_queue.put_nowait(None)
+            except queue.Full:
+                pass
+            viz_process.join(timeout=5)
+            if viz_process.is_alive():
+                viz_process.terminate()
         
         # Close consumer
         logger.info("Closing Kafka consumer...")
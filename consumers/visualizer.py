@@ -1,182 +1,256 @@
 """
 Basketball Visualizer
-Handles real-time Matplotlib animation of basketball game scores
+Handles real-time Matplotlib animation of basketball game scores.
+
+Runs in its own process, fed (game_time, score_home, score_away) tuples
+over a multiprocessing.Queue so GUI drawing never competes with the
+Kafka consumer for CPU.
 """
 
 #####################################
 # Import Modules
 #####################################
 
+import queue
+
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
-import threading
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from consumers.basketball_consumer import BasketballAnalytics
+import numpy as np
 
 from utils.utils_logger import logger
 
+# Import game configuration
+from data.game_config import get_all_team_names
+
+#####################################
+# Configuration
+#####################################
+
+MAX_EVENTS_TO_DISPLAY = 50  # Keep last 50 events for visualization
+
 #####################################
 # Visualizer Class
 #####################################
 
 class BasketballVisualizer:
     """Manages real-time visualization of basketball game scores"""
-    
-    def __init__(self, analytics: 'BasketballAnalytics'):
+
+    def __init__(self, score_queue):
         """
         Initialize the visualizer
-        
+
         Args:
-            analytics: BasketballAnalytics instance to get data from
+            score_queue: multiprocessing.Queue delivering
+                (game_time, score_home, score_away) tuples from the consumer
         """
-        self.analytics = analytics
+        self.score_queue = score_queue
+        self.home_team, self.away_team = get_all_team_names()
         self.fig: Figure = None
         self.ax: Axes = None
         self.animation_obj = None
-        self.running = False
-        
+        self._closing = False
+
+        # Persistent artists (created once in setup_plot, updated in animate)
+        self.home_line = None
+        self.away_line = None
+        self.legend = None
+        self.status_text = None
+        self.waiting_text = None
+
+        # Current scores
+        self.score_home = 0
+        self.score_away = 0
+
+        # Score history (NumPy ring buffers, same layout as the analytics side)
+        self._game_times = np.empty(MAX_EVENTS_TO_DISPLAY, dtype=object)
+        self._home_scores = np.zeros(MAX_EVENTS_TO_DISPLAY, dtype=np.int32)
+        self._away_scores = np.zeros(MAX_EVENTS_TO_DISPLAY, dtype=np.int32)
+        self._head = 0
+        self._count = 0
+
         logger.info("Visualizer initialized")
-    
+
     def setup_plot(self):
         """Set up the matplotlib figure and axes"""
         plt.style.use('seaborn-v0_8-darkgrid')
-        
+
         self.fig, self.ax = plt.subplots(figsize=(12, 6))
-        self.fig.suptitle('Live Basketball Game Score Tracker - Kafka Stream', 
+        self.fig.suptitle('Live Basketball Game Score Tracker - Kafka Stream',
                          fontsize=16, fontweight='bold')
-        
+
         self.ax.set_xlabel('Game Progression', fontsize=12)
         self.ax.set_ylabel('Points', fontsize=12)
         self.ax.set_ylim(0, 120)
         self.ax.grid(True, alpha=0.3)
-        
+
+        # Create the artists once; animate() only updates their data
+        # instead of tearing down and rebuilding the axes every frame
+        self.home_line, = self.ax.plot([], [], marker='o', linewidth=2,
+                                       markersize=6, color='#1f77b4',
+                                       label=self.home_team)
+        self.away_line, = self.ax.plot([], [], marker='o', linewidth=2,
+                                       markersize=6, color='#ff7f0e',
+                                       label=self.away_team)
+
+        self.legend = self.ax.legend(loc='upper left', fontsize=10)
+
+        self.status_text = self.ax.text(0.98, 0.02, '',
+                                        transform=self.ax.transAxes,
+                                        fontsize=11, fontweight='bold',
+                                        ha='right', va='bottom',
+                                        bbox=dict(boxstyle='round',
+                                                  facecolor='wheat', alpha=0.5))
+
+        self.waiting_text = self.ax.text(0.5, 0.5, 'Waiting for game data...',
+                                         transform=self.ax.transAxes,
+                                         fontsize=14, ha='center', va='center')
+
+        # Lay out once here rather than recomputing every frame
+        self.fig.tight_layout()
+
         logger.info("Plot setup complete")
-    
+
+    def _drain_queue(self):
+        """Pull all pending score updates off the queue (non-blocking)"""
+        while True:
+            try:
+                item = self.score_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            if item is None:
+                # Shutdown sentinel from the consumer process
+                self._closing = True
+                return
+
+            game_time, score_home, score_away = item
+            self.score_home = score_home
+            self.score_away = score_away
+
+            head = self._head
+            self._game_times[head] = game_time
+            self._home_scores[head] = score_home
+            self._away_scores[head] = score_away
+            self._head = (head + 1) % MAX_EVENTS_TO_DISPLAY
+            if self._count < MAX_EVENTS_TO_DISPLAY:
+                self._count += 1
+
+    def _ordered(self, buffer: np.ndarray) -> np.ndarray:
+        """Return ring buffer contents in chronological (oldest-first) order"""
+        if self._count < MAX_EVENTS_TO_DISPLAY:
+            return buffer[:self._count]
+        return np.concatenate((buffer[self._head:], buffer[:self._head]))
+
+    def get_visualization_data(self) -> dict:
+        """
+        Get current data for visualization
+
+        Returns:
+            Dictionary containing visualization data
+        """
+        return {
+            'game_times': self._ordered(self._game_times),
+            'home_scores': self._ordered(self._home_scores),
+            'away_scores': self._ordered(self._away_scores),
+            'home_team': self.home_team,
+            'away_team': self.away_team,
+            'current_home_score': self.score_home,
+            'current_away_score': self.score_away
+        }
+
     def animate(self, frame):
         """
         Animation function called by FuncAnimation
-        
+
         Args:
             frame: Frame number (unused but required by FuncAnimation)
         """
-        # Get current data from analytics
-        data = self.analytics.get_visualization_data()
-        
-        # Clear previous plot
-        self.ax.clear()
-        
-        # Re-apply styling
-        self.ax.set_xlabel('Game Progression', fontsize=12)
-        self.ax.set_ylabel('Points', fontsize=12)
-        self.ax.set_ylim(0, 120)
-        self.ax.grid(True, alpha=0.3)
-        
-        # Only plot if we have data
-        if len(data['game_times']) > 0:
-            # Create x-axis (just indices for simplicity)
-            x_vals = list(range(len(data['game_times'])))
-            
-            # Plot both teams' scores
-            self.ax.plot(x_vals, data['home_scores'], 
-                        marker='o', linewidth=2, markersize=6,
-                        color='#1f77b4', label=data['home_team'])
-            
-            self.ax.plot(x_vals, data['away_scores'], 
-                        marker='o', linewidth=2, markersize=6,
-                        color='#ff7f0e', label=data['away_team'])
-            
-            # Update x-axis labels with game times (show subset to avoid crowding)
-            step = max(1, len(data['game_times']) // 10)
-            tick_positions = x_vals[::step]
-            tick_labels = [data['game_times'][i] for i in tick_positions]
-            
-            self.ax.set_xticks(tick_positions)
-            self.ax.set_xticklabels(tick_labels, rotation=45, ha='right')
-            
-            # Calculate point differential
-            differential = abs(data['current_home_score'] - data['current_away_score'])
-            if data['current_home_score'] > data['current_away_score']:
-                leader = data['home_team']
-            elif data['current_away_score'] > data['current_home_score']:
-                leader = data['away_team']
-            else:
-                leader = "Tied"
-            
-            # Add legend with current scores
-            legend_text = [
-                f"{data['home_team']}: {data['current_home_score']}",
-                f"{data['away_team']}: {data['current_away_score']}"
-            ]
-            self.ax.legend(legend_text, loc='upper left', fontsize=10)
-            
-            # Add annotation with game status
-            if leader != "Tied":
-                status_text = f"{leader} leads by {differential}"
-            else:
-                status_text = "Game is tied!"
-            
-            self.ax.text(0.98, 0.02, status_text,
-                        transform=self.ax.transAxes,
-                        fontsize=11, fontweight='bold',
-                        ha='right', va='bottom',
-                        bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-        else:
-            # No data yet
-            self.ax.text(0.5, 0.5, 'Waiting for game data...',
-                        transform=self.ax.transAxes,
-                        fontsize=14, ha='center', va='center')
-        
-        plt.tight_layout()
-    
-    def start(self):
-        """Start the visualization in a separate thread"""
-        if self.running:
-            logger.warning("Visualizer already running")
+        # Ingest whatever the consumer has sent since the last frame
+        self._drain_queue()
+
+        if self._closing:
+            plt.close(self.fig)
             return
-        
-        self.running = True
-        
-        # Set up plot
+
+        data = self.get_visualization_data()
+        num_events = len(data['game_times'])
+
+        # Nothing to plot yet: leave the waiting message up
+        if num_events == 0:
+            return
+
+        self.waiting_text.set_visible(False)
+
+        # Update the persistent line artists in place (no axes rebuild)
+        x_vals = np.arange(num_events)
+        self.home_line.set_data(x_vals, data['home_scores'])
+        self.away_line.set_data(x_vals, data['away_scores'])
+        self.ax.set_xlim(-0.5, max(num_events - 0.5, 0.5))
+
+        # Update x-axis labels with game times (show subset to avoid crowding)
+        step = max(1, num_events // 10)
+        tick_positions = x_vals[::step]
+        tick_labels = [data['game_times'][i] for i in tick_positions]
+
+        self.ax.set_xticks(tick_positions)
+        self.ax.set_xticklabels(tick_labels, rotation=45, ha='right')
+
+        # Calculate point differential
+        differential = abs(data['current_home_score'] - data['current_away_score'])
+        if data['current_home_score'] > data['current_away_score']:
+            leader = data['home_team']
+        elif data['current_away_score'] > data['current_home_score']:
+            leader = data['away_team']
+        else:
+            leader = "Tied"
+
+        # Refresh legend entries with current scores
+        legend_texts = self.legend.get_texts()
+        legend_texts[0].set_text(f"{data['home_team']}: {data['current_home_score']}")
+        legend_texts[1].set_text(f"{data['away_team']}: {data['current_away_score']}")
+
+        # Refresh game status annotation
+        if leader != "Tied":
+            self.status_text.set_text(f"{leader} leads by {differential}")
+        else:
+            self.status_text.set_text("Game is tied!")
+
+    def run(self):
+        """Set up the plot and block on the Matplotlib event loop"""
         self.setup_plot()
-        
+
         # Create animation
         # interval=1000 means update every 1000ms (1 second)
         self.animation_obj = animation.FuncAnimation(
-            self.fig, 
+            self.fig,
             self.animate,
             interval=1000,
             cache_frame_data=False
         )
-        
+
         logger.info("Starting visualization...")
-        
-        # Start plot in non-blocking mode
-        plt.ion()
+
+        # Blocks until the figure is closed (or the shutdown sentinel arrives)
         plt.show()
-    
-    def update(self):
-        """Force an update of the visualization"""
-        if self.running and self.fig is not None:
-            try:
-                self.fig.canvas.draw_idle()
-                self.fig.canvas.flush_events()
-            except Exception as e:
-                logger.debug(f"Update error (likely normal during shutdown): {e}")
-    
-    def stop(self):
-        """Stop the visualization"""
-        if not self.running:
-            return
-        
-        logger.info("Stopping visualizer...")
-        self.running = False
-        
-        if self.animation_obj is not None:
-            self.animation_obj.event_source.stop()
-        
-        plt.close(self.fig)
-        logger.info("Visualizer stopped")
\ No newline at end of file
+
+#####################################
+# Child Process Entry Point
+#####################################
+
+def viz_main(score_queue):
+    """
+    Entry point for the visualizer child process
+
+    Args:
+        score_queue: multiprocessing.Queue of score tuples from the consumer
+    """
+    visualizer = BasketballVisualizer(score_queue)
+
+    try:
+        visualizer.run()
+    except KeyboardInterrupt:
+        pass
+
+    logger.info("Visualizer process exiting")
@@ -40,14 +40,27 @@ SCORING_BALANCE = {
     'home_team_probability': 0.50,  # 50% chance home team scores (balanced game)
 }
 
+# Precomputed constants so lookups need no chained dict .get() calls
+HOME_NAME = TEAMS['home']['name']
+AWAY_NAME = TEAMS['away']['name']
+HOME_PLAYERS = tuple(TEAMS['home']['players'])
+AWAY_PLAYERS = tuple(TEAMS['away']['players'])
+
+_BY_TYPE = {
+    'home': (HOME_NAME, HOME_PLAYERS),
+    'away': (AWAY_NAME, AWAY_PLAYERS),
+}
+
 def get_team_name(team_type: str) -> str:
     """Get team name by type (home or away)"""
-    return TEAMS.get(team_type, {}).get('name', 'Unknown')
+    entry = _BY_TYPE.get(team_type)
+    return entry[0] if entry else 'Unknown'
 
-def get_player_roster(team_type: str) -> list:
+def get_player_roster(team_type: str) -> tuple:
     """Get player roster by team type (home or away)"""
-    return TEAMS.get(team_type, {}).get('players', [])
+    entry = _BY_TYPE.get(team_type)
+    return entry[1] if entry else ()
 
 def get_all_team_names() -> tuple:
     """Get both team names as tuple (home, away)"""
-    return TEAMS['home']['name'], TEAMS['away']['name']
\ No newline at end of file
+    return HOME_NAME, AWAY_NAME
\ No newline at end of file
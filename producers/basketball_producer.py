@@ -7,10 +7,13 @@ Generates simulated basketball scoring events and streams them to Kafka
 # Import Modules
 #####################################
 
-import json
+import os
 import random
 import time
-from datetime import datetime
+
+import numpy as np
+import orjson
+from numba import njit
 
 # Import from existing utils
 from utils.utils_producer import (
@@ -35,6 +38,16 @@ from data.game_config import (
 
 TOPIC_NAME = "basketball-game"
 
+# Set PRODUCER_FAST_MODE=true to skip the between-score sleeps and stream
+# events back-to-back, relying on producer batching (load testing)
+FAST_MODE = os.getenv("PRODUCER_FAST_MODE", "false").strip().lower() in ("1", "true", "yes")
+
+# Hoisted out of the per-event path: fixed for the whole game
+HOME_TEAM_NAME = get_team_name('home')
+AWAY_TEAM_NAME = get_team_name('away')
+HOME_PLAYERS = tuple(get_player_roster('home'))
+AWAY_PLAYERS = tuple(get_player_roster('away'))
+
 #####################################
 # Game Simulation Functions
 #####################################
@@ -43,50 +56,143 @@ def format_game_time(quarter: int, minutes: int, seconds: int) -> str:
     """Format game time as 'Q# MM:SS'"""
     return f"Q{quarter} {minutes:02d}:{seconds:02d}"
 
-def generate_scoring_event(score_home: int, score_away: int, quarter: int, 
-                          minutes: int, seconds: int) -> dict:
+# Timestamp cache: strftime runs at most once per wall-clock second
+_last_second = 0
+_last_timestamp = ''
+
+def current_timestamp() -> str:
+    """Return 'YYYY-MM-DD HH:MM:SS', reformatting only when the second changes"""
+    global _last_second, _last_timestamp
+    now = int(time.time())
+    if now != _last_second:
+        _last_timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        _last_second = now
+    return _last_timestamp
+
+def generate_scoring_event(score_home: int, score_away: int, quarter: int,
+                          minutes: int, seconds: int, team_is_home: bool,
+                          points: int, player_id: int) -> tuple:
     """
-    Generate a single scoring event
-    
+    Build a single scoring event from pre-drawn random decisions
+
+    The random draws (team, points, player) are batched per quarter in
+    simulate_basketball_game, so this function does no RNG work itself.
+    Events use the compact positional wire format
+    [timestamp, game_time, team_id, player_id, points, score_home, score_away]
+    where team_id 0 = home, 1 = away.
+
     Returns:
-        Dictionary containing scoring event data
+        Tuple of (event list, updated score_home, updated score_away)
     """
-    # Determine which team scores
-    if random.random() < SCORING_BALANCE['home_team_probability']:
-        team_type = 'home'
-    else:
-        team_type = 'away'
-    
-    # Get team name and random player
-    team_name = get_team_name(team_type)
-    players = get_player_roster(team_type)
-    player = random.choice(players)
-    
-    # Determine if it's a 2-pointer or 3-pointer
-    if random.random() < GAME_PARAMS['three_point_probability']:
-        points = 3
-    else:
-        points = 2
-    
     # Update scores
-    if team_type == 'home':
+    if team_is_home:
+        team_id = 0
         score_home += points
     else:
+        team_id = 1
         score_away += points
-    
-    # Create event
-    event = {
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'game_time': format_game_time(quarter, minutes, seconds),
-        'team': team_name,
-        'player': player,
-        'points': points,
-        'score_home': score_home,
-        'score_away': score_away
-    }
-    
+
+    # Create event (positional: no field-name keys on the wire)
+    event = [
+        current_timestamp(),
+        format_game_time(quarter, minutes, seconds),
+        team_id,
+        player_id,
+        points,
+        score_home,
+        score_away
+    ]
+
     return event, score_home, score_away
 
+#####################################
+# Batch Event Generation (backfill / load testing)
+#####################################
+
+@njit(cache=True)
+def _simulate_batch(n: int, home_probability: float, three_point_probability: float,
+                    home_roster_size: int, away_roster_size: int, seed: int):
+    """
+    Roll all team/player/point decisions for n events and accumulate
+    the running scores in one native-code pass (cache=True so the
+    compiled kernel is reused across runs instead of recompiling)
+    """
+    np.random.seed(seed)
+
+    team_idx = (np.random.random(n) >= home_probability).astype(np.int8)  # 0=home, 1=away
+    player_draw = np.random.random(n)
+    points = np.where(np.random.random(n) < three_point_probability, 3, 2).astype(np.int32)
+
+    player_idx = np.empty(n, dtype=np.int8)
+    score_home = np.empty(n, dtype=np.int32)
+    score_away = np.empty(n, dtype=np.int32)
+    home = 0
+    away = 0
+    for i in range(n):
+        # Scale the player draw by the scoring team's own roster size
+        if team_idx[i] == 0:
+            player_idx[i] = int(player_draw[i] * home_roster_size)
+            home += points[i]
+        else:
+            player_idx[i] = int(player_draw[i] * away_roster_size)
+            away += points[i]
+        score_home[i] = home
+        score_away[i] = away
+
+    return team_idx, player_idx, points, score_home, score_away
+
+def generate_events_batch(n: int, seed: int = None) -> list:
+    """
+    Generate n scoring events in one vectorized batch
+
+    Much faster than calling generate_scoring_event in a loop; intended
+    for backfill/replay and load testing rather than the paced live
+    simulation. Events are spread evenly across the configured quarters.
+
+    Args:
+        n: Number of events to generate
+        seed: Optional RNG seed for reproducible batches
+
+    Returns:
+        List of orjson-encoded message bytes ready for producer.send
+    """
+    if seed is None:
+        seed = random.getrandbits(31)
+
+    team_idx, player_idx, points, score_home, score_away = _simulate_batch(
+        n,
+        SCORING_BALANCE['home_team_probability'],
+        GAME_PARAMS['three_point_probability'],
+        len(HOME_PLAYERS),
+        len(AWAY_PLAYERS),
+        seed
+    )
+
+    # One timestamp for the whole batch (synthetic events, not wall-clock)
+    timestamp = current_timestamp()
+
+    # Spread events evenly over the game clock
+    quarter_seconds = GAME_PARAMS['minutes_per_quarter'] * 60
+    total_seconds = GAME_PARAMS['quarters'] * quarter_seconds
+
+    messages = []
+    for i in range(n):
+        elapsed = i * total_seconds // max(n, 1)
+        quarter = min(elapsed // quarter_seconds + 1, GAME_PARAMS['quarters'])
+        remaining = quarter_seconds - (elapsed % quarter_seconds)
+
+        messages.append(orjson.dumps([
+            timestamp,
+            format_game_time(quarter, remaining // 60, remaining % 60),
+            int(team_idx[i]),
+            int(player_idx[i]),
+            int(points[i]),
+            int(score_home[i]),
+            int(score_away[i])
+        ]))
+
+    return messages
+
 def simulate_basketball_game(producer, topic_name: str):
     """
     Simulate a complete basketball game and stream events to Kafka
@@ -102,7 +208,14 @@ def simulate_basketball_game(producer, topic_name: str):
     score_home = 0
     score_away = 0
     total_events = 0
-    
+
+    # Dedicated RNG with locally-bound methods: each draw in the loops
+    # below skips the module-level attribute lookup on `random`
+    rng = random.Random()
+    _choices = rng.choices
+    _randint = rng.randint
+    _uniform = rng.uniform
+
     # Simulate all quarters
     for quarter in range(1, GAME_PARAMS['quarters'] + 1):
         logger.info(f"\n=== Quarter {quarter} ===")
@@ -112,41 +225,61 @@ def simulate_basketball_game(producer, topic_name: str):
         seconds = 0
         
         # Generate scoring events for this quarter
-        quarter_events = random.randint(8, 15)  # 8-15 scoring events per quarter
-        
-        for _ in range(quarter_events):
+        quarter_events = _randint(8, 15)  # 8-15 scoring events per quarter
+
+        # Pre-draw all random decisions for the quarter in four batched
+        # calls instead of three RNG round-trips per event
+        home_p = SCORING_BALANCE['home_team_probability']
+        three_p = GAME_PARAMS['three_point_probability']
+        team_choices = _choices((True, False), cum_weights=(home_p, 1.0),
+                                k=quarter_events)
+        point_choices = _choices((3, 2), cum_weights=(three_p, 1.0),
+                                 k=quarter_events)
+        home_picks = _choices(range(len(HOME_PLAYERS)), k=quarter_events)
+        away_picks = _choices(range(len(AWAY_PLAYERS)), k=quarter_events)
+
+        for i in range(quarter_events):
+            team_is_home = team_choices[i]
+            player_id = home_picks[i] if team_is_home else away_picks[i]
+
             # Generate scoring event
             event, score_home, score_away = generate_scoring_event(
-                score_home, score_away, quarter, minutes, seconds
+                score_home, score_away, quarter, minutes, seconds,
+                team_is_home, point_choices[i], player_id
             )
             
-            # Convert to JSON
-            message = json.dumps(event)
-            
+            # Convert to JSON (orjson returns bytes, so the serializer
+            # does not have to re-encode before handing off to Kafka)
+            message = orjson.dumps(event)
+
             # Send to Kafka
             try:
                 producer.send(topic_name, value=message)
                 total_events += 1
                 
-                # Log the event
+                # Log the event (names resolved locally; the wire carries ids)
                 logger.info(
-                    f"{event['game_time']} - {event['team']}: {event['player']} "
-                    f"scores {event['points']} points! "
-                    f"Score: {score_home}-{score_away}"
+                    "{} - {}: {} scores {} points! Score: {}-{}",
+                    event[1],
+                    HOME_TEAM_NAME if team_is_home else AWAY_TEAM_NAME,
+                    (HOME_PLAYERS if team_is_home else AWAY_PLAYERS)[player_id],
+                    point_choices[i], score_home, score_away
                 )
                 
             except Exception as e:
                 logger.error(f"Error sending message: {e}")
             
-            # Simulate time passing
-            time_delay = random.uniform(
-                GAME_PARAMS['seconds_between_scores'][0],
-                GAME_PARAMS['seconds_between_scores'][1]
-            )
-            time.sleep(time_delay / 10)  # Speed up simulation (divide by 10)
+            # Simulate time passing (skipped entirely in fast mode so
+            # sends accumulate in the producer's batch buffer)
+            if not FAST_MODE:
+                time_delay = _uniform(
+                    GAME_PARAMS['seconds_between_scores'][0],
+                    GAME_PARAMS['seconds_between_scores'][1]
+                )
+                time.sleep(time_delay / 10)  # Speed up simulation (divide by 10)
             
             # Update game clock (decrement)
-            seconds_passed = random.randint(20, 60)
+            seconds_passed = _randint(20, 60)
             total_seconds = minutes * 60 + seconds - seconds_passed
             
             if total_seconds < 0:
@@ -180,8 +313,16 @@ def main():
     # Create topic (fresh start)
     create_kafka_topic(TOPIC_NAME)
     
-    # Create producer
-    producer = create_kafka_producer()
+    # Create producer (messages are pre-encoded bytes, pass them through).
+    # linger_ms/batch_size let sends accumulate into 64 KB batches for up
+    # to 50ms, and lz4 compresses each produce request on the wire.
+    producer = create_kafka_producer(
+        value_serializer=lambda value: value,
+        linger_ms=50,
+        batch_size=64 * 1024,
+        compression_type='lz4',
+        acks=1,
+    )
     
     if producer is None:
         logger.error("Failed to create Kafka producer. Exiting...")
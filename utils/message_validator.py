@@ -1,85 +1,108 @@
 """
 Message Validator
 Validates JSON message format for basketball scoring events
+
+Events travel as compact positional JSON arrays
+[timestamp, game_time, team_id, player_id, points, score_home, score_away]
+rather than 7-key objects, roughly halving the per-message wire overhead.
+Team and player ids index into the shared game configuration.
 """
 
 import json
-from typing import Dict, Any, Optional
+from typing import Annotated, Literal, Optional, Union
+
+import msgspec
+
+from data.game_config import get_all_team_names, get_player_roster
+
+# Shared id -> name lookup tables (0 = home, 1 = away)
+_TEAM_NAMES = get_all_team_names()
+_ROSTERS = (tuple(get_player_roster('home')), tuple(get_player_roster('away')))
+
+# Non-negative score value (enforced by msgspec during decoding)
+Score = Annotated[int, msgspec.Meta(ge=0)]
+
+class Event(msgspec.Struct, array_like=True):
+    """
+    A basketball scoring event
+
+    Decoded and validated in one C-level pass by msgspec: missing fields,
+    wrong types, out-of-range scores, and bad points values are all
+    rejected at parse time. array_like=True maps the struct to the
+    positional wire format, so no field-name keys are shipped per event.
+    """
+    timestamp: str
+    game_time: str
+    team_id: Literal[0, 1]
+    player_id: Annotated[int, msgspec.Meta(ge=0)]
+    points: Literal[2, 3]
+    score_home: Score
+    score_away: Score
+
+    @property
+    def team(self) -> str:
+        """Team name resolved from the shared game configuration"""
+        return _TEAM_NAMES[self.team_id]
 
-def validate_message(message: str) -> tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+    @property
+    def player(self) -> str:
+        """Player name resolved from the shared game configuration"""
+        return _ROSTERS[self.team_id][self.player_id]
+
+# Reusable decoder bound to the Event schema
+_decoder = msgspec.json.Decoder(Event)
+
+def validate_message(message: Union[str, bytes]) -> tuple[bool, Optional[Event], Optional[str]]:
     """
     Validate a basketball scoring event message
-    
+
     Args:
-        message: JSON string to validate
-    
+        message: JSON string (or bytes) to validate
+
     Returns:
-        Tuple of (is_valid, parsed_data, error_message)
+        Tuple of (is_valid, decoded Event, error_message)
     """
-    # Required fields
-    required_fields = [
-        'timestamp',
-        'game_time',
-        'team',
-        'player',
-        'points',
-        'score_home',
-        'score_away'
-    ]
-    
     try:
-        # Parse JSON
-        data = json.loads(message)
-        
-        # Check all required fields exist
-        missing_fields = [field for field in required_fields if field not in data]
-        if missing_fields:
-            return False, None, f"Missing required fields: {missing_fields}"
-        
-        # Validate points value (should be 2 or 3)
-        if data['points'] not in [2, 3]:
-            return False, None, f"Invalid points value: {data['points']}. Must be 2 or 3."
-        
-        # Validate scores are non-negative integers
-        if not isinstance(data['score_home'], int) or data['score_home'] < 0:
-            return False, None, f"Invalid score_home: {data['score_home']}"
-        
-        if not isinstance(data['score_away'], int) or data['score_away'] < 0:
-            return False, None, f"Invalid score_away: {data['score_away']}"
-        
-        # All checks passed
-        return True, data, None
-        
-    except json.JSONDecodeError as e:
-        return False, None, f"Invalid JSON format: {str(e)}"
+        event = _decoder.decode(message)
+    except msgspec.ValidationError as e:
+        return False, None, f"Invalid message: {e}"
+    except msgspec.DecodeError as e:
+        return False, None, f"Invalid JSON format: {e}"
     except Exception as e:
-        return False, None, f"Validation error: {str(e)}"
+        return False, None, f"Validation error: {e}"
+
+    # Roster bounds are config-dependent, so msgspec cannot check them
+    if event.player_id >= len(_ROSTERS[event.team_id]):
+        return False, None, f"Invalid player_id: {event.player_id}"
 
+    return True, event, None
 
-def create_message(timestamp: str, game_time: str, team: str, player: str, 
+
+# Precompiled message template: the JSON shape is fixed, so one %
+# substitution replaces list construction plus a json.dumps call
+_TEMPLATE = '["%s","%s",%d,%d,%d,%d,%d]'
+
+def create_message(timestamp: str, game_time: str, team_id: int, player_id: int,
                    points: int, score_home: int, score_away: int) -> str:
     """
     Create a valid basketball scoring event message
-    
+
     Args:
         timestamp: Event timestamp
         game_time: Game clock time (e.g., "Q2 8:45")
-        team: Team name
-        player: Player name
+        team_id: Team index (0 = home, 1 = away)
+        player_id: Player index into the team's roster
         points: Points scored (2 or 3)
         score_home: Current home team score
         score_away: Current away team score
-    
+
     Returns:
-        JSON string of the message
+        JSON string of the message (positional array format)
     """
-    message = {
-        'timestamp': timestamp,
-        'game_time': game_time,
-        'team': team,
-        'player': player,
-        'points': points,
-        'score_home': score_home,
-        'score_away': score_away
-    }
-    return json.dumps(message)
\ No newline at end of file
+    if '"' in timestamp or '\\' in timestamp or '"' in game_time or '\\' in game_time:
+        # Rare fallback for strings that need JSON escaping
+        return json.dumps([timestamp, game_time, team_id, player_id,
+                           points, score_home, score_away])
+
+    return _TEMPLATE % (timestamp, game_time, team_id, player_id,
+                        points, score_home, score_away)
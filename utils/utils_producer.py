@@ -84,6 +84,7 @@ def verify_services():
 
 def create_kafka_producer(
     value_serializer: Optional[Callable[[Any], bytes]] = None,
+    **producer_config: Any,
 ) -> Optional[KafkaProducer]:
     """
     Create and return a Kafka producer instance.
@@ -91,6 +92,9 @@ def create_kafka_producer(
     Args:
         value_serializer (callable): A custom serializer for message values.
                                      Defaults to UTF-8 string encoding.
+        **producer_config: Additional KafkaProducer settings passed through
+                           as-is (e.g. linger_ms, batch_size,
+                           compression_type, acks).
 
     Returns:
         KafkaProducer: Configured Kafka producer instance.
@@ -109,6 +113,7 @@ def create_kafka_producer(
         producer = KafkaProducer(
             bootstrap_servers=kafka_broker,
             value_serializer=value_serializer,
+            **producer_config,
         )
         logger.info("Kafka producer successfully created.")
         return producer